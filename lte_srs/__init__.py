@@ -4,6 +4,7 @@ from .sequences import (
     apply_cyclic_shift,
     generate_prs,
     generate_srs,
+    generate_srs_batch,
     generate_zadoff_chu,
     group_and_sequence_hopping,
     map_to_frequency_grid,
@@ -15,6 +16,7 @@ __all__ = [
     "HoppingState",
     "MappingInfo",
     "generate_srs",
+    "generate_srs_batch",
     "generate_zadoff_chu",
     "apply_cyclic_shift",
     "map_to_frequency_grid",
@@ -0,0 +1,24 @@
+"""Ahead-of-time build of the Gold sequence kernel.
+
+Running ``python -m lte_srs._prs_aot`` compiles :func:`_prs_core_loop`
+into the ``_prs_ext`` extension next to this module. When present,
+:mod:`lte_srs.sequences` imports it instead of JIT-compiling the kernel
+with Numba on first use, so the first ``generate_prs`` call costs no
+more than loading the shared library. Building requires Numba and a C
+compiler; the extension itself only needs NumPy at runtime.
+"""
+from __future__ import annotations
+
+import os
+
+from numba.pycc import CC
+
+from .sequences import _prs_core_loop
+
+cc = CC("_prs_ext")
+cc.output_dir = os.path.dirname(os.path.abspath(__file__))
+cc.export("prs_core", "u1[:](i8, i8)")(_prs_core_loop)
+
+
+if __name__ == "__main__":
+    cc.compile()
@@ -1,13 +1,121 @@
 """Core signal generation utilities for LTE SRS."""
 from __future__ import annotations
 
-from typing import Tuple
+import math
+from functools import lru_cache
+from typing import Iterable, List, Optional, Tuple
 
 import numpy as np
 
+try:  # SciPy's pocketfft exposes worker threads and in-place transforms
+    import scipy.fft as _fft
+
+    _HAS_SCIPY_FFT = True
+except ImportError:  # pragma: no cover - SciPy is optional
+    _fft = np.fft
+    _HAS_SCIPY_FFT = False
+
+try:  # Numba compiles the per-chip PRS recursion to machine code
+    import numba as _numba
+except ImportError:  # pragma: no cover - Numba is optional
+    _numba = None
+
+try:  # numexpr fuses elementwise complex expressions without temporaries
+    import numexpr as _numexpr
+except ImportError:  # pragma: no cover - numexpr is optional
+    _numexpr = None
+
 from .config import HoppingState, MappingInfo, SRSConfig
 
 
+_PRS_REGISTER_BITS = 31
+_PRS_REGISTER_MASK = (1 << _PRS_REGISTER_BITS) - 1
+# Feedback taps ``t`` of the recursions x(n + 31) = XOR_t x(n + t).
+_PRS_X1_TAPS = (0, 28)
+_PRS_X2_TAPS = (0, 28, 29, 30)
+# x1 always starts from the same register contents (every third chip set).
+_PRS_X1_SEED = sum(1 << n for n in range(0, _PRS_REGISTER_BITS, 3))
+_PRS_X1_PRECOMPUTED = 1600
+_SLOTS_PER_FRAME = 20
+
+
+def _ifft(freq_grid: np.ndarray, axis: int = -1) -> np.ndarray:
+    """Inverse FFT that may overwrite ``freq_grid`` when SciPy is available."""
+
+    if not _HAS_SCIPY_FFT:
+        return _fft.ifft(freq_grid, axis=axis)
+    return _fft.ifft(freq_grid, axis=axis, overwrite_x=True, workers=-1)
+
+
+def _lfsr_sequence(seed: int, taps: Tuple[int, ...], length: int) -> np.ndarray:
+    """Return the ``length`` chips that follow a 31-chip LFSR ``seed``.
+
+    The chips are accumulated in a Python integer whose bit ``i`` holds
+    ``x(i)``. Squaring the feedback polynomial over GF(2) ``k`` times
+    gives x(n + 31b) = XOR_t x(n + tb) with ``b = 2**k``, so once ``31b``
+    chips are known the next ``b`` chips come from one shift/XOR per tap.
+    The block size doubles as the register fills, keeping the number of
+    Python-level steps logarithmic in ``length``.
+    """
+
+    chips = seed & _PRS_REGISTER_MASK
+    count = _PRS_REGISTER_BITS
+    total = length + _PRS_REGISTER_BITS
+    block = 1
+    while count < total:
+        while _PRS_REGISTER_BITS * block * 2 <= count:
+            block *= 2
+        base = count - _PRS_REGISTER_BITS * block
+        chunk = 0
+        for tap in taps:
+            chunk ^= chips >> (base + tap * block)
+        chips |= (chunk & ((1 << block) - 1)) << count
+        count += block
+    length = max(length, 0)
+    chips = (chips >> _PRS_REGISTER_BITS) & ((1 << length) - 1)
+    packed = chips.to_bytes(length // 8 + 1, "little")
+    bits = np.unpackbits(np.frombuffer(packed, dtype=np.uint8), bitorder="little")
+    return bits[:length]
+
+
+_PRS_X1_CHIPS = _lfsr_sequence(_PRS_X1_SEED, _PRS_X1_TAPS, _PRS_X1_PRECOMPUTED)
+_PRS_X1_CHIPS.setflags(write=False)
+
+
+def _prs_core_swar(c_init: int, length: int) -> np.ndarray:
+    """Gold sequence chips built from word-wide LFSR steps."""
+
+    if length <= _PRS_X1_PRECOMPUTED:
+        x1 = _PRS_X1_CHIPS[:length]
+    else:
+        x1 = _lfsr_sequence(_PRS_X1_SEED, _PRS_X1_TAPS, length)
+    x2 = _lfsr_sequence(c_init, _PRS_X2_TAPS, length)
+    return np.bitwise_xor(x1, x2)
+
+
+def _prs_core_loop(c_init: int, length: int) -> np.ndarray:
+    """Gold sequence chips from the per-chip recursion, compiled by Numba."""
+
+    x1 = np.empty(length + 31, dtype=np.uint8)
+    x2 = np.empty(length + 31, dtype=np.uint8)
+    for n in range(31):
+        x1[n] = (_PRS_X1_SEED >> n) & 1
+        x2[n] = (c_init >> n) & 1
+    for n in range(31, length + 31):
+        x1[n] = x1[n - 3] ^ x1[n - 31]
+        x2[n] = x2[n - 3] ^ x2[n - 2] ^ x2[n - 1] ^ x2[n - 31]
+    return x1[31:] ^ x2[31:]
+
+
+try:  # extension built ahead of time with ``python -m lte_srs._prs_aot``
+    from ._prs_ext import prs_core as _prs_core
+except ImportError:
+    if _numba is not None:
+        _prs_core = _numba.njit(cache=True, boundscheck=False)(_prs_core_loop)
+    else:  # pragma: no cover - exercised when Numba is missing
+        _prs_core = _prs_core_swar
+
+
 def generate_prs(c_init: int, length: int) -> np.ndarray:
     """Generate a pseudo-random binary sequence using the LTE Gold sequence.
 
@@ -17,19 +125,29 @@ def generate_prs(c_init: int, length: int) -> np.ndarray:
         Initialization state as defined by 3GPP TS 36.211 section 7.2.
     length: int
         Number of sequence elements to produce.
+
+    Returns
+    -------
+    numpy.ndarray
+        ``uint8`` array of chips in ``{0, 1}``.
     """
 
-    x1 = np.zeros(length + 31, dtype=int)
-    x2 = np.zeros(length + 31, dtype=int)
-    x1[0] = 1
-    for n in range(1, length + 31):
-        x1[n] = (x1[n - 3] + x1[n - 31]) % 2
-    for n in range(31):
-        x2[n] = (c_init >> n) & 1
-    for n in range(31, length + 31):
-        x2[n] = (x2[n - 3] + x2[n - 2] + x2[n - 1] + x2[n - 31]) % 2
-    c = (x1[31:] + x2[31:]) % 2
-    return c[:length]
+    return _prs_core(int(c_init) & _PRS_REGISTER_MASK, max(int(length), 0))
+
+
+@lru_cache(maxsize=512)
+def _prs_for_cell(cell_id: int) -> np.ndarray:
+    """Return the read-only group hopping PRS of one radio frame, one byte per slot.
+
+    TS 36.211 section 5.5.1.3 initializes the generator with
+    ``c_init = floor(cell_id / 30)`` at the start of each radio frame, so
+    one frame's chips serve every frame. Byte ``n_s`` holds
+    ``sum(c(8 * n_s + i) << i for i in range(8))``.
+    """
+
+    c = np.packbits(generate_prs(cell_id // 30, 8 * _SLOTS_PER_FRAME), bitorder="little")
+    c.setflags(write=False)
+    return c
 
 
 def group_and_sequence_hopping(config: SRSConfig, slot_index: int) -> HoppingState:
@@ -43,10 +161,8 @@ def group_and_sequence_hopping(config: SRSConfig, slot_index: int) -> HoppingSta
 
     f_ss = config.cell_id % 30
     if config.group_hopping_enabled:
-        c_init = ((slot_index // 2 + 1) * (config.cell_id + 1) * (2 ** 9) + config.cell_id) % (2 ** 31)
-        c = generate_prs(c_init, 8 * (slot_index + 1))
-        start = 8 * slot_index
-        f_gh = int(sum(int(c[start + i]) << i for i in range(8))) % 30
+        # n_s counts slots within the radio frame
+        f_gh = int(_prs_for_cell(config.cell_id)[slot_index % _SLOTS_PER_FRAME]) % 30
     else:
         f_gh = 0
 
@@ -62,38 +178,191 @@ def group_and_sequence_hopping(config: SRSConfig, slot_index: int) -> HoppingSta
     return HoppingState(group_number=group_number, sequence_number=sequence_number, f_gh=f_gh, f_ss=f_ss)
 
 
+def _unit_phasor(theta: np.ndarray) -> np.ndarray:
+    """Return ``exp(1j * theta)`` as ``complex64`` for ``float32`` angles."""
+
+    out = np.empty(theta.shape, dtype=np.complex64)
+    out.real = np.cos(theta)
+    out.imag = np.sin(theta)
+    return out
+
+
+@lru_cache(maxsize=64)
+def _nn1(length: int) -> np.ndarray:
+    """Return the read-only ``n * (n + 1)`` table for ``n < length``."""
+
+    n = np.arange(length, dtype=np.int64)
+    table = n * (n + 1)
+    table.setflags(write=False)
+    return table
+
+
+@lru_cache(maxsize=256)
+def _zc_cached(u: int, N_zc: int) -> np.ndarray:
+    """Return the read-only Zadoff-Chu base sequence for ``(u, N_zc)``.
+
+    The phase ``u * n * (n + 1)`` is reduced modulo ``2 * N_zc`` in
+    integer arithmetic first, so the angle stays within one turn and can
+    be evaluated in single precision without losing accuracy.
+    """
+
+    phase = (_nn1(N_zc) % (2 * N_zc)) * u % (2 * N_zc)
+    theta = phase.astype(np.float32) * np.float32(-np.pi / N_zc)
+    seq = _unit_phasor(theta)
+    seq.setflags(write=False)
+    return seq
+
+
 def generate_zadoff_chu(u: int, N_zc: int) -> np.ndarray:
-    """Generate the complex Zadoff-Chu base sequence."""
+    """Generate the complex Zadoff-Chu base sequence.
 
-    n = np.arange(N_zc)
-    return np.exp(-1j * np.pi * u * n * (n + 1) / N_zc)
+    Sequences are cached per ``(u, N_zc)``; callers receive their own copy.
+    """
+
+    return _zc_cached(u, N_zc).copy()
 
 
 def apply_cyclic_shift(seq: np.ndarray, alpha: float) -> np.ndarray:
-    """Apply cyclic shift ``alpha`` to a base sequence."""
+    """Apply cyclic shift ``alpha`` to a base sequence.
+
+    With numexpr installed the phase ramp, exponential and product are
+    evaluated blockwise in one pass.
+    """
 
     n = np.arange(len(seq))
-    return seq * np.exp(1j * alpha * n)
+    if _numexpr is not None:
+        seq = np.asarray(seq)
+        out = np.empty(len(seq), dtype=np.result_type(seq.dtype, np.complex64))
+        alpha = float(alpha)
+        return _numexpr.evaluate("seq * exp(1j * alpha * n)", out=out, casting="same_kind")
+    theta = np.mod(alpha * n, 2 * np.pi).astype(np.float32)
+    return seq * _unit_phasor(theta)
+
+
+@lru_cache(maxsize=256)
+def _generate_srs_baseband(u: int, N_zc: int, m_sc: int, alpha: float) -> np.ndarray:
+    """Return the first ``m_sc`` cyclically shifted Zadoff-Chu samples.
+
+    Equivalent to ``apply_cyclic_shift(generate_zadoff_chu(u, N_zc)[:m_sc],
+    alpha)`` but only the occupied samples are computed and the ZC phase
+    and the cyclic shift ramp are summed before a single phasor sweep.
+    Results are cached and read-only since a UE only ever cycles through
+    the 30 sequence groups for its fixed bandwidth and cyclic shift.
+    """
+
+    n = np.arange(min(m_sc, N_zc), dtype=np.int64)
+    zc_phase = (_nn1(N_zc)[: len(n)] % (2 * N_zc)) * u % (2 * N_zc)
+    theta = np.mod(alpha * n - (np.pi / N_zc) * zc_phase, 2 * np.pi).astype(np.float32)
+    seq = _unit_phasor(theta)
+    seq.setflags(write=False)
+    return seq
+
+
+def _comb_k0(n_fft: int, m_sc, spacing, comb):
+    """Return the first comb bin ``k0`` in the FFT-shifted domain.
+
+    Works element-wise on arrays as well as on scalars.
+    """
 
+    return n_fft // 2 - (m_sc // 2) * spacing + comb
 
-def map_to_frequency_grid(seq: np.ndarray, config: SRSConfig, n_fft: int) -> Tuple[np.ndarray, int]:
+
+def _mapping_info(
+    config: SRSConfig, subframe_index: int, slot_index: int, hopping: HoppingState, m_sc: int, n_fft: int, k0: int
+) -> MappingInfo:
+    """Build the :class:`MappingInfo` describing one generated SRS."""
+
+    return MappingInfo(
+        subframe_index=subframe_index,
+        slot_index=slot_index,
+        root_index=hopping.sequence_number,
+        alpha=config.alpha,
+        m_sc=int(m_sc),
+        comb=config.transmission_comb,
+        n_fft=n_fft,
+        k0=int(k0),
+        hopping=hopping,
+    )
+
+
+def _fill_comb_segment(segment: np.ndarray, offset: int, seq: np.ndarray, k0: int, spacing: int) -> None:
+    """Write the shifted-domain bins ``offset .. offset + len(segment)`` of a comb.
+
+    Bin ``k0 + m * spacing`` carries ``seq[m]``; every other bin of the
+    segment is zeroed. Only the guard bands and the comb gaps are written
+    with zeros, so each bin is touched exactly once.
+    """
+
+    stop = offset + len(segment)
+    m_start = max(0, -((k0 - offset) // spacing))
+    m_stop = max(m_start, min(len(seq), -((k0 - stop) // spacing)))
+    if m_stop == m_start:
+        segment.fill(0)
+        return
+    first = k0 + m_start * spacing - offset
+    last = k0 + (m_stop - 1) * spacing - offset + 1
+    segment[:first] = 0
+    segment[last:] = 0
+    segment[first:last:spacing] = seq[m_start:m_stop]
+    for gap in range(1, spacing):
+        segment[first + gap : last : spacing] = 0
+
+
+def _write_comb(freq_grid: np.ndarray, seq: np.ndarray, k0: int, spacing: int) -> None:
+    """Write a comb starting at shifted-domain bin ``k0`` into a DC-first grid.
+
+    The DC-first grid is the shifted grid rotated by ``n_fft // 2``:
+    shifted bins ``[center, n_fft)`` land at the start of ``freq_grid`` and
+    bins ``[0, center)`` at its end, exactly as ``ifftshift`` would place
+    them.
+    """
+
+    n_fft = len(freq_grid)
+    center = n_fft // 2
+    _fill_comb_segment(freq_grid[: n_fft - center], center, seq, k0, spacing)
+    _fill_comb_segment(freq_grid[n_fft - center :], 0, seq, k0, spacing)
+
+
+def map_to_frequency_grid(
+    seq: np.ndarray, config: SRSConfig, n_fft: int, out: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, int]:
     """Map an SRS sequence to a frequency grid with a transmission comb.
 
     Returns the grid with DC at index 0 (IFFT-ready) and the starting
     index ``k0`` used for the comb mapping in the FFT-shifted domain.
+    If ``out`` is given (length ``n_fft``), the grid is written into it
+    and ``out`` is returned instead of a new array.
     """
 
-    grid_shifted = np.zeros(n_fft, dtype=complex)
     spacing = config.comb_spacing()
-    center = n_fft // 2
-    m_sc = len(seq)
-    k0 = center - (m_sc // 2) * spacing + config.transmission_comb
-    for m, value in enumerate(seq):
-        k = k0 + m * spacing
-        if 0 <= k < n_fft:
-            grid_shifted[k] = value
-    freq_grid = np.fft.ifftshift(grid_shifted)
-    return freq_grid, k0
+    k0 = _comb_k0(n_fft, len(seq), spacing, config.transmission_comb)
+    if out is None:
+        out = np.empty(n_fft, dtype=np.complex64)
+    elif len(out) != n_fft:
+        raise ValueError("out must have n_fft elements")
+    _write_comb(out, seq, k0, spacing)
+    return out, k0
+
+
+def _srs_sequence(config: SRSConfig, subframe_index: int) -> Tuple[np.ndarray, int, HoppingState, int]:
+    """Return the shifted SRS sequence, slot index, hopping state and ``M_sc``."""
+
+    if not config.is_active_subframe(subframe_index):
+        raise ValueError(f"Subframe {subframe_index} is not active for this UE (T_srs={config.subframe_config}).")
+
+    slot_index = subframe_index * 2  # two slots per subframe
+    hopping = group_and_sequence_hopping(config, slot_index)
+    m_sc = config.bandwidth_in_subcarriers()
+    seq = _generate_srs_baseband(hopping.sequence_number, config.zc_length, m_sc, config.alpha)
+    return seq, slot_index, hopping, m_sc
+
+
+def _srs_frequency_grid(config: SRSConfig, subframe_index: int, n_fft: int) -> Tuple[np.ndarray, MappingInfo]:
+    """Return the IFFT-ready SRS frequency grid and its mapping metadata."""
+
+    shifted_seq, slot_index, hopping, m_sc = _srs_sequence(config, subframe_index)
+    freq_grid, k0 = map_to_frequency_grid(shifted_seq, config, n_fft)
+    return freq_grid, _mapping_info(config, subframe_index, slot_index, hopping, m_sc, n_fft, k0)
 
 
 def generate_srs(config: SRSConfig, subframe_index: int, n_fft: int = 2048) -> Tuple[np.ndarray, MappingInfo]:
@@ -103,52 +372,94 @@ def generate_srs(config: SRSConfig, subframe_index: int, n_fft: int = 2048) -> T
     :class:`MappingInfo` structure summarizing the configuration used.
     """
 
-    if not config.is_active_subframe(subframe_index):
-        raise ValueError(f"Subframe {subframe_index} is not active for this UE (T_srs={config.subframe_config}).")
+    freq_grid, info = _srs_frequency_grid(config, subframe_index, n_fft)
+    return _ifft(freq_grid), info
 
-    slot_index = subframe_index * 2  # two slots per subframe
-    hopping = group_and_sequence_hopping(config, slot_index)
-    root_index = hopping.sequence_number
 
-    N_zc = config.zc_length
-    base_seq = generate_zadoff_chu(root_index, N_zc)
+def generate_srs_batch(
+    configs: Iterable[SRSConfig], subframe_index: int, n_fft: int = 2048
+) -> Tuple[np.ndarray, List[MappingInfo]]:
+    """Generate the SRS of several UEs for the same subframe.
 
-    m_sc = config.bandwidth_in_subcarriers()
-    truncated_seq = base_seq[:m_sc]
-    shifted_seq = apply_cyclic_shift(truncated_seq, config.alpha)
+    Equivalent to calling :func:`generate_srs` for each configuration.
+    The per-UE parameters are gathered into arrays so the sequences of
+    all UEs are produced by one 2-D phase computation, mapped with one
+    fancy-indexed store and synthesized with one batched IFFT. Returns an
+    array of shape ``(len(configs), n_fft)`` whose rows are the
+    time-domain signals, together with their mapping metadata.
+    """
 
-    freq_grid, k0 = map_to_frequency_grid(shifted_seq, config, n_fft)
-    time_signal = np.fft.ifft(freq_grid)
+    configs = list(configs)
+    if not configs:
+        return np.empty((0, n_fft), dtype=np.complex64), []
+    for config in configs:
+        if not config.is_active_subframe(subframe_index):
+            raise ValueError(f"Subframe {subframe_index} is not active for this UE (T_srs={config.subframe_config}).")
 
-    info = MappingInfo(
-        subframe_index=subframe_index,
-        slot_index=slot_index,
-        root_index=root_index,
-        alpha=config.alpha,
-        m_sc=m_sc,
-        comb=config.transmission_comb,
-        n_fft=n_fft,
-        k0=k0,
-        hopping=hopping,
-    )
-    return time_signal, info
+    slot_index = subframe_index * 2  # two slots per subframe
+    hoppings = [group_and_sequence_hopping(config, slot_index) for config in configs]
+    count = len(configs)
+    roots = np.fromiter((h.sequence_number for h in hoppings), dtype=np.int64, count=count)
+    n_zc = np.fromiter((c.zc_length for c in configs), dtype=np.int64, count=count)
+    alphas = np.fromiter((c.alpha for c in configs), dtype=np.float64, count=count)
+    m_sc = np.fromiter((c.bandwidth_in_subcarriers() for c in configs), dtype=np.int64, count=count)
+    spacings = np.fromiter((c.comb_spacing() for c in configs), dtype=np.int64, count=count)
+    combs = np.fromiter((c.transmission_comb for c in configs), dtype=np.int64, count=count)
+
+    # one row per UE, padded to the longest sequence, same phase as _generate_srs_baseband
+    lengths = np.minimum(m_sc, n_zc)
+    n = np.arange(lengths.max(), dtype=np.int64)
+    two_n_zc = 2 * n_zc[:, None]
+    zc_phase = (_nn1(int(n_zc.max()))[: len(n)] % two_n_zc) * roots[:, None] % two_n_zc
+    theta = np.mod(alphas[:, None] * n - (np.pi / n_zc[:, None]) * zc_phase, 2 * np.pi).astype(np.float32)
+    seqs = _unit_phasor(theta)
+
+    center = n_fft // 2
+    k0 = _comb_k0(n_fft, lengths, spacings, combs)
+    k = k0[:, None] + n * spacings[:, None]
+    occupied = (n < lengths[:, None]) & (k >= 0) & (k < n_fft)
+    rows = np.broadcast_to(np.arange(count)[:, None], k.shape)
+    grids = np.zeros((count, n_fft), dtype=np.complex64)
+    # (k - center) % n_fft is the DC-first position ifftshift would give
+    grids[rows[occupied], (k[occupied] - center) % n_fft] = seqs[occupied]
+
+    infos = [
+        _mapping_info(config, subframe_index, slot_index, hopping, m, n_fft, k0_i)
+        for config, hopping, m, k0_i in zip(configs, hoppings, m_sc, k0)
+    ]
+    return _ifft(grids, axis=1), infos
 
 
 def normalized_cross_correlation(a: np.ndarray, b: np.ndarray) -> float:
-    """Compute the normalized cross-correlation magnitude between two signals."""
+    """Compute the normalized cross-correlation magnitude between two signals.
+
+    Inputs are evaluated in single precision; for equal-length signals the
+    zero-lag correlation and both energies are plain inner products.
+    """
 
     if len(a) != len(b):
         raise ValueError("Signals must be the same length for correlation")
-    norm_a = np.linalg.norm(a)
-    norm_b = np.linalg.norm(b)
-    if norm_a == 0 or norm_b == 0:
+    a = np.asarray(a).astype(np.complex64, copy=False)
+    b = np.asarray(b).astype(np.complex64, copy=False)
+    peak_a = float(np.abs(a).max()) if len(a) else 0.0
+    peak_b = float(np.abs(b).max()) if len(b) else 0.0
+    if peak_a == 0 or peak_b == 0:
         return 0.0
-    corr = np.correlate(a, b, mode="valid")[0]
-    return float(abs(corr) / (norm_a * norm_b))
+    # scaled to unit peak, so the complex64 correlation sum stays within len(a)
+    a = a / np.float32(peak_a)
+    b = b / np.float32(peak_b)
+    # energies accumulate in float64 from the float32 real/imag view
+    parts_a = a.view(np.float32).astype(np.float64)
+    parts_b = b.view(np.float32).astype(np.float64)
+    energy_a = float(np.dot(parts_a, parts_a))
+    energy_b = float(np.dot(parts_b, parts_b))
+    corr = np.vdot(a, b)
+    return float(abs(corr)) / (math.sqrt(energy_a) * math.sqrt(energy_b))
 
 
 __all__ = [
     "generate_srs",
+    "generate_srs_batch",
     "group_and_sequence_hopping",
     "generate_zadoff_chu",
     "apply_cyclic_shift",
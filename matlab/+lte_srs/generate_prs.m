@@ -25,16 +25,16 @@ Computation details
 * Recurrence: the implementation advances both registers forward, storing
   ``len`` additional chips to avoid negative indexing while matching the
   recursion offsets in the specification (e.g., ``x1(n+31)=x1(n+3)+x1(n)``).
-* Combination: the Gold sequence is ``mod(x1 + x2, 2)`` starting at index
+* Combination: the Gold sequence is ``bitxor(x1, x2)`` starting at index
   32 (MATLAB 1-indexed) to align with :math:`n=0` in the standard, and the
   result is truncated to ``len`` chips for downstream use.
 %}
 
 function c = generate_prs(c_init, len)
 
-    % Shift-register states (first 31 chips hold the seeds)
-    x1 = zeros(len + 31, 1);
-    x2 = zeros(len + 31, 1);
+    % Shift-register states (first 31 chips hold the seeds), one byte per chip
+    x1 = zeros(len + 31, 1, 'uint8');
+    x2 = zeros(len + 31, 1, 'uint8');
 
     % x1 seed: x1(1)=1, x1(2..31)=0
     x1(1) = 1;
@@ -46,11 +46,11 @@ function c = generate_prs(c_init, len)
 
     % Generate remaining chips moving forward to avoid negative indices
     for n = 1:len
-        x1(n + 31) = mod(x1(n + 3) + x1(n), 2);
-        x2(n + 31) = mod(x2(n + 3) + x2(n + 2) + x2(n + 1) + x2(n), 2);
+        x1(n + 31) = bitxor(x1(n + 3), x1(n));
+        x2(n + 31) = bitxor(bitxor(x2(n + 3), x2(n + 2)), bitxor(x2(n + 1), x2(n)));
     end
 
     % Gold sequence
-    c = mod(x1(32:end) + x2(32:end), 2);
+    c = double(bitxor(x1(32:end), x2(32:end)));
     c = c(1:len);
 end
@@ -2,9 +2,11 @@ function hopping = group_and_sequence_hopping(config, slot_index)
 %GROUP_AND_SEQUENCE_HOPPING Compute group and sequence hopping indices.
     f_ss = mod(config.cell_id, 30);
     if config.group_hopping_enabled
-        c_init = mod(((floor(slot_index / 2) + 1) * (config.cell_id + 1) * (2 ^ 9) + config.cell_id), 2 ^ 31);
-        c = lte_srs.generate_prs(c_init, 8 * (slot_index + 1));
-        start_idx = 8 * slot_index + 1;
+        c_init = floor(config.cell_id / 30);
+        % the generator restarts every radio frame (20 slots)
+        n_s = mod(slot_index, 20);
+        c = lte_srs.generate_prs(c_init, 8 * (n_s + 1));
+        start_idx = 8 * n_s + 1;
         f_gh = 0;
         for i = 0:7
             f_gh = f_gh + bitshift(c(start_idx + i), i);
@@ -1,20 +1,29 @@
 """Test and visualization harness for LTE SRS generation."""
 from __future__ import annotations
 
-import itertools
 from dataclasses import dataclass
 from typing import Iterable, List, Tuple
 
-import importlib.util
 import numpy as np
 
+try:  # SciPy exposes the Hermitian rank-k update (herk) from BLAS
+    from scipy.linalg.blas import get_blas_funcs
+except ImportError:  # pragma: no cover - SciPy is optional
+    get_blas_funcs = None
+
+try:
+    import matplotlib.pyplot as plt
+except ImportError:  # pragma: no cover - plotting is optional
+    plt = None
+
 from lte_srs import (
     MappingInfo,
     SRSConfig,
-    generate_srs,
-    normalized_cross_correlation,
+    generate_srs_batch,
 )
 
+HAS_MPL = plt is not None
+
 
 @dataclass
 class SRSResult:
@@ -46,37 +55,48 @@ def build_configurations() -> List[SRSConfig]:
 
 
 def generate_signals(configs: Iterable[SRSConfig], subframe: int) -> List[SRSResult]:
-    results: List[SRSResult] = []
-    for cfg in configs:
-        sig, info = generate_srs(cfg, subframe)
-        results.append(SRSResult(signal=sig, info=info))
-    return results
+    signals, infos = generate_srs_batch(configs, subframe)
+    return [SRSResult(signal=sig, info=info) for sig, info in zip(signals, infos)]
 
 
 def correlation_matrix(results: List[SRSResult]) -> np.ndarray:
-    """Compute the normalized correlation matrix for a set of signals."""
+    """Compute the normalized correlation matrix for a set of signals.
+
+    For equal-length signals the zero-lag correlation of every pair is an
+    inner product, so the whole matrix is the Gram matrix of the stacked
+    signals. The matrix is Hermitian; with SciPy only its upper triangle
+    is computed (BLAS ``herk``) and mirrored.
+    """
 
     n = len(results)
     corr = np.zeros((n, n))
-    for i, j in itertools.product(range(n), repeat=2):
-        corr[i, j] = normalized_cross_correlation(results[i].signal, results[j].signal)
+    if n == 0:
+        return corr
+    signals = np.vstack([r.signal for r in results])
+    # herk only exists for complex dtypes, so real signals are promoted first
+    signals = signals.astype(np.result_type(signals.dtype, np.complex64), copy=False)
+    if get_blas_funcs is None:
+        magnitude = np.abs(np.conj(signals) @ signals.T)
+    else:
+        herk = get_blas_funcs("herk", (signals,))
+        magnitude = np.abs(np.triu(herk(1.0, signals)))
+        magnitude += np.triu(magnitude, k=1).T
+    norms = np.linalg.norm(signals, axis=1)
+    denom = np.outer(norms, norms)
+    np.divide(magnitude, denom, out=corr, where=denom > 0)
     return corr
 
 
 def highlight_pairs(corr: np.ndarray, threshold: float = 0.3) -> List[Tuple[int, int, float]]:
     """Return pairs with correlation magnitude above a threshold."""
 
-    pairs: List[Tuple[int, int, float]] = []
-    n = corr.shape[0]
-    for i in range(n):
-        for j in range(i + 1, n):
-            if corr[i, j] > threshold:
-                pairs.append((i, j, corr[i, j]))
-    return pairs
+    i_idx, j_idx = np.nonzero(np.triu(corr > threshold, k=1))
+    return list(zip(i_idx.tolist(), j_idx.tolist(), corr[i_idx, j_idx].tolist()))
 
 
 def plot_correlation(corr: np.ndarray, labels: List[str], path: str = "correlation_matrix.png") -> str:
-    import matplotlib.pyplot as plt
+    if plt is None:
+        raise ImportError("matplotlib is required for plot_correlation")
 
     fig, ax = plt.subplots(figsize=(6, 5))
     im = ax.imshow(corr, vmin=0, vmax=1, cmap="viridis")
@@ -94,7 +114,7 @@ def plot_correlation(corr: np.ndarray, labels: List[str], path: str = "correlati
 
 
 def has_matplotlib() -> bool:
-    return importlib.util.find_spec("matplotlib") is not None
+    return HAS_MPL
 
 
 def main() -> None: